@@ -52,7 +52,7 @@ class EndToEndReader(MarkdownReader):
         # are annotated in the json format (e.g. `/greet{"name": "Rasa"})
         if message.startswith(INTENT_MESSAGE_PREFIX):
             parsed = self._regex_interpreter.synchronous_parse(message)
-            example.data["entities"] = parsed["entities"]
+            example.set("entities", parsed["entities"])
 
-        example.data["true_intent"] = intent
+        example.set("true_intent", intent)
         return example
@@ -44,7 +44,9 @@ class SpacyFeaturizer(DenseFeaturizer):
 
     def _features_for_doc(self, doc: "Doc") -> np.ndarray:
         """Feature vector for a single document / sentence / tokens."""
-        return np.array([t.vector for t in doc if t.text and t.text.strip()])
+        return np.array(
+            [t.vector for t in doc if t.text and t.text.strip()], dtype=np.float32
+        )
 
     def train(
         self,
@@ -1,6 +1,6 @@
 import numpy as np
 import scipy.sparse
-from typing import Text, Union, Optional, Dict, Any
+from typing import Text, Union, Optional, Dict, Any, List
 
 from rasa.nlu.constants import FEATURIZER_CLASS_ALIAS
 from rasa.nlu.constants import VALID_FEATURE_TYPES
@@ -11,6 +11,8 @@ from rasa.utils.tensorflow.constants import MEAN_POOLING, MAX_POOLING
 class Features:
     """Stores the features produces by any featurizer."""
 
+    __slots__ = ("features", "type", "origin", "message_attribute", "_is_sparse")
+
     def __init__(
         self,
         features: Union[np.ndarray, scipy.sparse.spmatrix],
@@ -20,10 +22,18 @@ class Features:
     ) -> None:
         self._validate_feature_type(feature_type)
 
+        if isinstance(features, np.ndarray):
+            # store dense features as C-contiguous float32 arrays, so that combining
+            # them does not create hidden copies or upcasts; featurizers should pass
+            # in float32 arrays already to avoid the copy here
+            dtype = np.float32 if features.dtype == np.float64 else features.dtype
+            features = np.ascontiguousarray(features, dtype=dtype)
+
         self.features = features
         self.type = feature_type
         self.origin = origin
         self.message_attribute = message_attribute
+        self._is_sparse = isinstance(features, scipy.sparse.spmatrix)
 
     @staticmethod
     def _validate_feature_type(feature_type: Text) -> None:
@@ -39,7 +49,7 @@ class Features:
         Returns:
             True, if features are sparse, false otherwise.
         """
-        return isinstance(self.features, scipy.sparse.spmatrix)
+        return self._is_sparse
 
     def is_dense(self) -> bool:
         """Checks if features are dense or not.
@@ -47,7 +57,7 @@ class Features:
         Returns:
             True, if features are dense, false otherwise.
         """
-        return not self.is_sparse()
+        return not self._is_sparse
 
     def combine_with_features(
         self, additional_features: Optional[Union[np.ndarray, scipy.sparse.spmatrix]]
@@ -64,38 +74,66 @@ class Features:
             return self.features
 
         if self.is_dense() and isinstance(additional_features, np.ndarray):
-            return self._combine_dense_features(self.features, additional_features)
+            return self._combine_dense_features([self.features, additional_features])
 
         if self.is_sparse() and isinstance(additional_features, scipy.sparse.spmatrix):
-            return self._combine_sparse_features(self.features, additional_features)
+            return self._combine_sparse_features([self.features, additional_features])
 
         raise ValueError("Cannot combine sparse and dense features.")
 
     @staticmethod
-    def _combine_dense_features(
-        features: np.ndarray, additional_features: np.ndarray
-    ) -> np.ndarray:
-        if features.ndim != additional_features.ndim:
+    def combine(
+        features: List["Features"],
+    ) -> Optional[Union[np.ndarray, scipy.sparse.spmatrix]]:
+        """Combine the given features into a single feature matrix.
+
+        The feature matrices are concatenated along the last dimension in the order
+        they are given in.
+
+        Args:
+            features: features to combine
+
+        Returns:
+            Combined features or `None` if no features are given.
+        """
+        if not features:
+            return None
+
+        if len(features) == 1:
+            return features[0].features
+
+        if any(f.is_sparse() != features[0].is_sparse() for f in features):
+            raise ValueError("Cannot combine sparse and dense features.")
+
+        matrices = [f.features for f in features]
+        if features[0].is_sparse():
+            return Features._combine_sparse_features(matrices)
+
+        return Features._combine_dense_features(matrices)
+
+    @staticmethod
+    def _combine_dense_features(features: List[np.ndarray]) -> np.ndarray:
+        dimensions = [f.ndim for f in features]
+        if len(set(dimensions)) > 1:
             raise ValueError(
                 f"Cannot combine dense features as sequence dimensions do not "
-                f"match: {features.ndim} != {additional_features.ndim}."
+                f"match: {dimensions}."
             )
 
-        return np.concatenate((features, additional_features), axis=-1)
+        return np.concatenate(features, axis=-1)
 
     @staticmethod
     def _combine_sparse_features(
-        features: scipy.sparse.spmatrix, additional_features: scipy.sparse.spmatrix
+        features: List[scipy.sparse.spmatrix],
     ) -> scipy.sparse.spmatrix:
-        from scipy.sparse import hstack
-
-        if features.shape[0] != additional_features.shape[0]:
+        sequence_lengths = [f.shape[0] for f in features]
+        if len(set(sequence_lengths)) > 1:
             raise ValueError(
                 f"Cannot combine sparse features as sequence dimensions do not "
-                f"match: {features.shape[0]} != {additional_features.shape[0]}."
+                f"match: {sequence_lengths}."
             )
 
-        return hstack([features, additional_features])
+        return scipy.sparse.hstack(features)
 
 
 class Featurizer(Component):
@@ -115,17 +153,20 @@ class DenseFeaturizer(Featurizer):
         features: np.ndarray, pooling_operation: Text
     ) -> np.ndarray:
         # take only non zeros feature vectors into account
-        non_zero_features = np.array([f for f in features if f.any()])
+        non_zero_vectors = features.any(axis=-1)
+        num_non_zero_vectors = np.count_nonzero(non_zero_vectors)
 
         # if features are all zero just return a vector with all zeros
-        if non_zero_features.size == 0:
-            return np.zeros([1, features.shape[-1]])
+        if num_non_zero_vectors == 0:
+            return np.zeros([1, features.shape[-1]], dtype=features.dtype)
 
         if pooling_operation == MEAN_POOLING:
-            return np.mean(non_zero_features, axis=0, keepdims=True)
+            # zero vectors do not change the sum, so there is no need to copy the
+            # non zero vectors out of the feature matrix first
+            return np.sum(features, axis=0, keepdims=True) / num_non_zero_vectors
 
         if pooling_operation == MAX_POOLING:
-            return np.max(non_zero_features, axis=0, keepdims=True)
+            return np.max(features[non_zero_vectors], axis=0, keepdims=True)
 
         raise ValueError(
             f"Invalid pooling operation specified. Available operations are "
@@ -1,4 +1,7 @@
-from typing import Any, Optional, Tuple, Text, Dict, Set, List, Union
+from typing import Any, Optional, Tuple, Text, Dict, Set, List, Union, Hashable
+
+import sys
+from collections import defaultdict
 
 import numpy as np
 import scipy.sparse
@@ -13,6 +16,7 @@ from rasa.nlu.constants import (
     RESPONSE_IDENTIFIER_DELIMITER,
     FEATURE_TYPE_SEQUENCE,
     FEATURE_TYPE_SENTENCE,
+    VALID_FEATURE_TYPES,
 )
 from rasa.nlu.utils import ordered
 
@@ -20,7 +24,44 @@ if typing.TYPE_CHECKING:
     from rasa.nlu.featurizers.featurizer import Features
 
 
+def _freeze(obj: Any) -> Hashable:
+    """Converts the (ordered) message data into a hashable structure."""
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(o) for o in obj)
+
+    try:
+        hash(obj)
+    except TypeError:
+        # e.g. dicts inside of tuples or numpy arrays
+        return str(obj)
+
+    return obj
+
+
 class Message:
+    """A single message, e.g. a training example or an incoming user message.
+
+    `Message.add_features` is the only supported way to add features to a message.
+    `Message.features` is a read-only tuple, so appending to it or assigning to it
+    is not possible.
+
+    The data of a message must be changed via `Message.set`: the hash of a message
+    and its combined intent response key are cached and only reset by `set`.
+    Changing `Message.data` (or values inside of it) in place leaves these cached
+    values outdated.
+    """
+
+    __slots__ = (
+        "text",
+        "time",
+        "data",
+        "_features",
+        "output_properties",
+        "_hash",
+        "_combined_intent_response_key",
+        "_features_by_key",
+    )
+
     def __init__(
         self,
         text: Text,
@@ -33,7 +74,13 @@ class Message:
         self.text = text
         self.time = time
         self.data = data if data else {}
-        self.features = features if features else []
+        self._features = []
+        # features grouped by message attribute, sparseness and feature type
+        self._features_by_key: Dict[
+            Tuple[Text, bool, Text], List["Features"]
+        ] = defaultdict(list)
+        for f in features or []:
+            self.add_features(f)
 
         self.data.update(**kwargs)
 
@@ -42,9 +89,46 @@ class Message:
         else:
             self.output_properties = set()
 
+        # cached values derived from the data, reset whenever the data changes via
+        # `set`
+        self._hash = None
+        self._combined_intent_response_key = None
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # cached values and the features index are neither copied nor pickled,
+        # they are recomputed if needed
+        return {
+            attribute: getattr(self, attribute)
+            for attribute in self.__slots__
+            if attribute
+            not in ("_hash", "_combined_intent_response_key", "_features_by_key")
+        }
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        features = state.pop("_features")
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+        self._hash = None
+        self._combined_intent_response_key = None
+
+        self._features = []
+        self._features_by_key = defaultdict(list)
+        for f in features:
+            self.add_features(f)
+
+    @property
+    def features(self) -> Tuple["Features", ...]:
+        """Features of the message, use `add_features` to add new features."""
+        return tuple(self._features)
+
     def add_features(self, features: Optional["Features"]) -> None:
         if features is not None:
-            self.features.append(features)
+            self._features.append(features)
+            self._features_by_key[self._features_key(features)].append(features)
+
+    @staticmethod
+    def _features_key(features: "Features") -> Tuple[Text, bool, Text]:
+        return features.message_attribute, features.is_sparse(), features.type
 
     def set(self, prop, info, add_to_output=False) -> None:
         if prop == TEXT:
@@ -53,6 +137,9 @@ class Message:
             self.data[prop] = info
             if add_to_output:
                 self.output_properties.add(prop)
+            if prop in (INTENT, RESPONSE_KEY_ATTRIBUTE):
+                self._combined_intent_response_key = None
+        self._hash = None
 
     def get(self, prop, default=None) -> Any:
         if prop == TEXT:
@@ -70,29 +157,31 @@ class Message:
         return d
 
     def as_dict(self, only_output_properties=False) -> dict:
-        if only_output_properties:
-            d = {
-                key: value
-                for key, value in self.data.items()
-                if key in self.output_properties
-            }
-        else:
-            d = self.data
-
         # Filter all keys with None value. These could have come while building the
         # Message object in markdown format
-        d = {key: value for key, value in d.items() if value is not None}
+        d = {
+            key: value
+            for key, value in self.data.items()
+            if value is not None
+            and (not only_output_properties or key in self.output_properties)
+        }
+        d[TEXT] = self.text
 
-        return dict(d, text=self.text)
+        return d
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Message):
             return False
-        else:
-            return (other.text, ordered(other.data)) == (self.text, ordered(self.data))
+        if other.text != self.text:
+            return False
+        # identical data is always equal, only fall back to the order independent
+        # comparison if the data differs
+        return other.data == self.data or ordered(other.data) == ordered(self.data)
 
     def __hash__(self) -> int:
-        return hash((self.text, str(ordered(self.data))))
+        if self._hash is None:
+            self._hash = hash((self.text, _freeze(ordered(self.data))))
+        return self._hash
 
     @classmethod
     def build(cls, text, intent=None, entities=None, **kwargs) -> "Message":
@@ -109,21 +198,26 @@ class Message:
     def get_combined_intent_response_key(self) -> Text:
         """Get intent as it appears in training data"""
 
-        intent = self.get(INTENT)
-        response_key = self.get(RESPONSE_KEY_ATTRIBUTE)
-        response_key_suffix = (
-            f"{RESPONSE_IDENTIFIER_DELIMITER}{response_key}" if response_key else ""
-        )
-        return f"{intent}{response_key_suffix}"
+        if self._combined_intent_response_key is None:
+            intent = self.get(INTENT)
+            response_key = self.get(RESPONSE_KEY_ATTRIBUTE)
+            response_key_suffix = (
+                f"{RESPONSE_IDENTIFIER_DELIMITER}{response_key}" if response_key else ""
+            )
+            self._combined_intent_response_key = f"{intent}{response_key_suffix}"
+
+        return self._combined_intent_response_key
 
     @staticmethod
     def separate_intent_response_key(original_intent) -> Optional[Tuple[Any, Any]]:
+        # most intents are not retrieval intents, so avoid splitting them; intent
+        # names are interned as they are used as keys over and over again
+        if RESPONSE_IDENTIFIER_DELIMITER not in original_intent:
+            return sys.intern(original_intent), None
 
         split_title = original_intent.split(RESPONSE_IDENTIFIER_DELIMITER)
         if len(split_title) == 2:
-            return split_title[0], split_title[1]
-        elif len(split_title) == 1:
-            return split_title[0], None
+            return sys.intern(split_title[0]), split_title[1]
 
     def get_sparse_features(
         self, attribute: Text, featurizers: Optional[List[Text]] = None
@@ -143,8 +237,8 @@ class Message:
         if featurizers is None:
             featurizers = []
 
-        sequence_features, sentence_features = self._filter_sparse_features(
-            attribute, featurizers
+        sequence_features, sentence_features = self._filter_features(
+            attribute, featurizers, sparse=True
         )
 
         sequence_features = self._combine_features(sequence_features)
@@ -170,8 +264,8 @@ class Message:
         if featurizers is None:
             featurizers = []
 
-        sequence_features, sentence_features = self._filter_dense_features(
-            attribute, featurizers
+        sequence_features, sentence_features = self._filter_features(
+            attribute, featurizers, sparse=False
         )
 
         sequence_features = self._combine_features(sequence_features)
@@ -194,64 +288,33 @@ class Message:
         Returns:
             ``True``, if features are present, ``False`` otherwise
         """
-        if featurizers is None:
-            featurizers = []
-
-        (
-            sequence_sparse_features,
-            sentence_sparse_features,
-        ) = self._filter_sparse_features(attribute, featurizers)
-        sequence_dense_features, sentence_dense_features = self._filter_dense_features(
-            attribute, featurizers
-        )
+        featurizers = set(featurizers or [])
 
-        return (
-            len(sequence_sparse_features) > 0
-            or len(sentence_sparse_features) > 0
-            or len(sequence_dense_features) > 0
-            or len(sentence_dense_features) > 0
+        return any(
+            not featurizers or f.origin in featurizers
+            for sparse in (True, False)
+            for feature_type in VALID_FEATURE_TYPES
+            for f in self._features_by_key.get((attribute, sparse, feature_type), ())
         )
 
-    def _filter_dense_features(
-        self, attribute: Text, featurizers: List[Text]
+    def _filter_features(
+        self, attribute: Text, featurizers: List[Text], sparse: bool
     ) -> Tuple[List["Features"], List["Features"]]:
-        sentence_features = [
-            f
-            for f in self.features
-            if f.message_attribute == attribute
-            and f.is_dense()
-            and f.type == FEATURE_TYPE_SENTENCE
-            and (f.origin in featurizers or not featurizers)
-        ]
-        sequence_features = [
-            f
-            for f in self.features
-            if f.message_attribute == attribute
-            and f.is_dense()
-            and f.type == FEATURE_TYPE_SEQUENCE
-            and (f.origin in featurizers or not featurizers)
-        ]
-        return sequence_features, sentence_features
+        sequence_features = self._features_by_key.get(
+            (attribute, sparse, FEATURE_TYPE_SEQUENCE), []
+        )
+        sentence_features = self._features_by_key.get(
+            (attribute, sparse, FEATURE_TYPE_SENTENCE), []
+        )
 
-    def _filter_sparse_features(
-        self, attribute: Text, featurizers: List[Text]
-    ) -> Tuple[List["Features"], List["Features"]]:
-        sentence_features = [
-            f
-            for f in self.features
-            if f.message_attribute == attribute
-            and f.is_sparse()
-            and f.type == FEATURE_TYPE_SENTENCE
-            and (f.origin in featurizers or not featurizers)
-        ]
-        sequence_features = [
-            f
-            for f in self.features
-            if f.message_attribute == attribute
-            and f.is_sparse()
-            and f.type == FEATURE_TYPE_SEQUENCE
-            and (f.origin in featurizers or not featurizers)
-        ]
+        if featurizers:
+            featurizers = set(featurizers)
+            sequence_features = [
+                f for f in sequence_features if f.origin in featurizers
+            ]
+            sentence_features = [
+                f for f in sentence_features if f.origin in featurizers
+            ]
 
         return sequence_features, sentence_features
 
@@ -259,9 +322,10 @@ class Message:
     def _combine_features(
         features: List["Features"],
     ) -> Optional[Union[np.ndarray, scipy.sparse.spmatrix]]:
-        combined_features = None
-
-        for f in features:
-            combined_features = f.combine_with_features(combined_features)
+        if not features:
+            return None
 
-        return combined_features
+        # `Features` cannot be imported at module level (the featurizer module
+        # depends on this module), so its static `combine` is reached through an
+        # instance; features are stacked in reverse order of how they were added
+        return features[-1].combine(features[::-1])
@@ -6,6 +6,7 @@ from rasa.nlu.components import Component
 from rasa.nlu.config import RasaNLUModelConfig, override_defaults
 from rasa.nlu.training_data import Message, TrainingData
 from rasa.nlu.model import InvalidModelError
+from rasa.utils.common import raise_warning
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,16 @@ class SpacyNLP(Component):
         # applications and models it makes sense to differentiate
         # between these two words, therefore setting this to `True`.
         "case_sensitive": False,
+        # number of texts that are buffered and processed together by spaCy
+        # when the training data is converted into spaCy docs
+        "batch_size": 50,
+        # number of processes spaCy uses to convert the training data into docs,
+        # `-1` uses all available CPU cores (requires spaCy >= 2.2.2)
+        "n_process": 1,
+        # names of spaCy pipeline components that should not run when creating
+        # the docs of the messages, e.g. `["ner", "parser", "tagger"]` if only
+        # tokens and word vectors are used in the rest of the pipeline
+        "disable": [],
     }
 
     def __init__(
@@ -39,6 +50,25 @@ class SpacyNLP(Component):
         self.nlp = nlp
         super().__init__(component_config)
 
+        self._ensure_parallel_processing_is_supported()
+
+    def _ensure_parallel_processing_is_supported(self) -> None:
+        """Falls back to a single process if spaCy cannot process texts in parallel."""
+        if self.component_config["n_process"] == 1:
+            return
+
+        import spacy
+        from packaging import version
+
+        spacy_version = spacy.about.__version__
+        if version.parse(spacy_version) < version.parse("2.2.2"):
+            raise_warning(
+                f"Option 'n_process' of '{self.name}' requires spaCy 2.2.2 or later, "
+                f"but spaCy {spacy_version} is installed. Texts will be processed "
+                f"in a single process."
+            )
+            self.component_config["n_process"] = 1
+
     @staticmethod
     def load_model(spacy_model_name: Text) -> "Language":
         """Try loading the model, catching the OSError if missing."""
@@ -89,14 +119,27 @@ class SpacyNLP(Component):
         # as the model name if no explicit name is defined
         spacy_model_name = component_meta.get("model", model_metadata.language)
 
-        return cls.name + "-" + spacy_model_name
+        # components that only share the model name, but create their docs
+        # differently, must not be reused for each other
+        disable = component_meta.get("disable", cls.defaults["disable"])
+        batch_size = component_meta.get("batch_size", cls.defaults["batch_size"])
+        n_process = component_meta.get("n_process", cls.defaults["n_process"])
+
+        return (
+            f"{cls.name}-{spacy_model_name}"
+            f"-disable={','.join(sorted(disable))}"
+            f"-batch_size={batch_size}"
+            f"-n_process={n_process}"
+        )
 
     def provide_context(self) -> Dict[Text, Any]:
         return {"spacy_nlp": self.nlp}
 
     def doc_for_text(self, text: Text) -> "Doc":
 
-        return self.nlp(self.preprocess_text(text))
+        return self.nlp(
+            self.preprocess_text(text), disable=self.component_config["disable"]
+        )
 
     def preprocess_text(self, text: Optional[Text]) -> Text:
 
@@ -150,16 +193,19 @@ class SpacyNLP(Component):
     ) -> List[Tuple[int, "Doc"]]:
         """Sends content bearing training samples to spaCy's pipe."""
 
+        pipe_kwargs = {
+            "batch_size": self.component_config["batch_size"],
+            "disable": self.component_config["disable"],
+        }
+        # only pass `n_process` if needed, as spaCy < 2.2.2 does not support it
+        if self.component_config["n_process"] != 1:
+            pipe_kwargs["n_process"] = self.component_config["n_process"]
+
         docs = [
             (to_pipe_sample[0], doc)
             for to_pipe_sample, doc in zip(
                 samples_to_pipe,
-                [
-                    doc
-                    for doc in self.nlp.pipe(
-                        [txt for _, txt in samples_to_pipe], batch_size=50
-                    )
-                ],
+                self.nlp.pipe([txt for _, txt in samples_to_pipe], **pipe_kwargs),
             )
         ]
         return docs
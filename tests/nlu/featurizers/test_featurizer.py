@@ -27,6 +27,19 @@ from rasa.nlu.constants import (
 from rasa.utils.tensorflow.constants import FEATURIZERS
 
 
+def test_dense_features_are_contiguous_float32():
+    features = Features(
+        np.asfortranarray(np.array([[1.0, 0.5], [0.0, 2.0]], dtype=np.float64)),
+        FEATURE_TYPE_SEQUENCE,
+        TEXT,
+        "test",
+    )
+
+    assert features.features.dtype == np.float32
+    assert features.features.flags["C_CONTIGUOUS"]
+    assert np.all(features.features == np.array([[1.0, 0.5], [0.0, 2.0]]))
+
+
 def test_combine_with_existing_dense_features():
     existing_features = Features(
         np.array([[1, 0, 2, 3], [2, 0, 0, 1]]), FEATURE_TYPE_SEQUENCE, TEXT, "test"
@@ -78,6 +91,29 @@ def test_combine_with_existing_sparse_features_shape_mismatch():
         existing_features.combine_with_features(new_features)
 
 
+def test_combine_features():
+    features = [
+        Features(np.array([[1, 0], [0, 1]]), FEATURE_TYPE_SEQUENCE, TEXT, "a"),
+        Features(np.array([[2], [3]]), FEATURE_TYPE_SEQUENCE, TEXT, "b"),
+        Features(np.array([[4, 5], [6, 7]]), FEATURE_TYPE_SEQUENCE, TEXT, "c"),
+    ]
+    expected_features = np.array([[1, 0, 2, 4, 5], [0, 1, 3, 6, 7]])
+
+    actual_features = Features.combine(features)
+
+    assert np.all(expected_features == actual_features)
+
+
+def test_combine_sparse_and_dense_features():
+    features = [
+        Features(np.array([[1, 0]]), FEATURE_TYPE_SEQUENCE, TEXT, "a"),
+        Features(scipy.sparse.csr_matrix([[1, 0]]), FEATURE_TYPE_SEQUENCE, TEXT, "b"),
+    ]
+
+    with pytest.raises(ValueError):
+        Features.combine(features)
+
+
 @pytest.mark.parametrize(
     "pooling, features, expected",
     [
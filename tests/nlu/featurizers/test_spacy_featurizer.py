@@ -41,6 +41,22 @@ def test_spacy_featurizer(sentence, spacy_nlp):
     assert np.allclose(vecs, expected, atol=1e-5)
 
 
+def test_spacy_featurizer_oov_and_whitespace_tokens(spacy_nlp):
+    ftr = SpacyFeaturizer.create({}, RasaNLUModelConfig())
+
+    # "qwxzvbnmqwxz" has no vector and the double space creates a whitespace token
+    doc = spacy_nlp("hey  qwxzvbnmqwxz how are you")
+    assert any(t.text.isspace() for t in doc)
+    assert any(not t.has_vector for t in doc)
+
+    vecs = ftr._features_for_doc(doc)
+    expected = np.array([t.vector for t in doc if t.text.strip()])
+
+    assert vecs.dtype == np.float32
+    assert vecs.shape == expected.shape
+    assert np.allclose(vecs, expected, atol=1e-5)
+
+
 def test_spacy_training_sample_alignment(spacy_nlp_component):
     from spacy.tokens import Doc
 
@@ -1,3 +1,4 @@
+import copy
 from typing import Optional, Text, List
 
 import pytest
@@ -5,7 +6,14 @@ import numpy as np
 import scipy.sparse
 
 from rasa.nlu.featurizers.featurizer import Features
-from rasa.nlu.constants import TEXT, FEATURE_TYPE_SEQUENCE, FEATURE_TYPE_SENTENCE
+from rasa.nlu.constants import (
+    TEXT,
+    INTENT,
+    ENTITIES,
+    RESPONSE_KEY_ATTRIBUTE,
+    FEATURE_TYPE_SEQUENCE,
+    FEATURE_TYPE_SENTENCE,
+)
 from rasa.nlu.training_data import Message
 
 
@@ -31,6 +39,17 @@ from rasa.nlu.training_data import Message
             [1, 2, 1, 1, 1, 0],
             [1, 2, 2],
         ),
+        (
+            [
+                Features(np.array([1, 1, 0]), FEATURE_TYPE_SEQUENCE, TEXT, "c3"),
+                Features(np.array([1, 2, 1]), FEATURE_TYPE_SEQUENCE, TEXT, "c2"),
+                Features(np.array([2, 2, 2]), FEATURE_TYPE_SEQUENCE, TEXT, "c1"),
+            ],
+            TEXT,
+            [],
+            [2, 2, 2, 1, 2, 1, 1, 1, 0],
+            None,
+        ),
         (
             [
                 Features(np.array([1, 1, 0]), FEATURE_TYPE_SEQUENCE, TEXT, "c1"),
@@ -106,6 +125,32 @@ def test_get_dense_features(
             [1, 2, 1, 1, 1, 0],
             [1, 2, 2],
         ),
+        (
+            [
+                Features(
+                    scipy.sparse.csr_matrix([1, 1, 0]),
+                    FEATURE_TYPE_SEQUENCE,
+                    TEXT,
+                    "c3",
+                ),
+                Features(
+                    scipy.sparse.csr_matrix([1, 2, 1]),
+                    FEATURE_TYPE_SEQUENCE,
+                    TEXT,
+                    "c2",
+                ),
+                Features(
+                    scipy.sparse.csr_matrix([2, 2, 2]),
+                    FEATURE_TYPE_SEQUENCE,
+                    TEXT,
+                    "c1",
+                ),
+            ],
+            TEXT,
+            [],
+            [2, 2, 2, 1, 2, 1, 1, 1, 0],
+            None,
+        ),
         (
             [
                 Features(
@@ -232,3 +277,105 @@ def test_features_present(
     actual = message.features_present(attribute, featurizers)
 
     assert actual == expected
+
+
+def test_hash_changes_after_set():
+    message = Message("hello", data={INTENT: "greet"})
+    initial_hash = hash(message)
+
+    message.set(INTENT, "goodbye")
+    intent_hash = hash(message)
+
+    message.set(TEXT, "bye")
+    text_hash = hash(message)
+
+    assert intent_hash != initial_hash
+    assert text_hash != intent_hash
+    assert message == Message("bye", data={INTENT: "goodbye"})
+    assert hash(message) == hash(Message("bye", data={INTENT: "goodbye"}))
+
+
+def test_equal_messages_hash_equal():
+    entities = [
+        {"entity": "city", "value": "Berlin", "start": 0, "end": 6},
+        {"entity": "country", "value": "Germany", "start": 7, "end": 14},
+    ]
+    message = Message("Berlin Germany", data={INTENT: "inform", ENTITIES: entities})
+    other = Message("Berlin Germany", data={ENTITIES: entities[::-1], INTENT: "inform"})
+
+    assert message == other
+    assert hash(message) == hash(other)
+    assert len({message, other}) == 1
+
+
+def test_copied_message_does_not_keep_cached_hash():
+    message = Message("hello", data={INTENT: "greet"})
+    hash(message)
+
+    copied = copy.deepcopy(message)
+    copied.data[INTENT] = "goodbye"
+
+    assert hash(copied) == hash(Message("hello", data={INTENT: "goodbye"}))
+
+
+def test_combined_intent_response_key_is_rebuilt_after_set():
+    message = Message.build(text="what's the weather", intent="chitchat/ask_weather")
+    assert message.get_combined_intent_response_key() == "chitchat/ask_weather"
+
+    message.set(INTENT, "faq")
+    assert message.get_combined_intent_response_key() == "faq/ask_weather"
+
+    message.set(RESPONSE_KEY_ATTRIBUTE, "ask_name")
+    assert message.get_combined_intent_response_key() == "faq/ask_name"
+
+    message.set(RESPONSE_KEY_ATTRIBUTE, None)
+    assert message.get_combined_intent_response_key() == "faq"
+
+
+def test_features_added_after_creation_are_returned():
+    message = Message("This is a test sentence.")
+    assert not message.features_present(TEXT)
+
+    message.add_features(
+        Features(np.array([1, 1, 0]), FEATURE_TYPE_SEQUENCE, TEXT, "dense")
+    )
+    message.add_features(
+        Features(scipy.sparse.csr_matrix([1, 2, 1]), FEATURE_TYPE_SENTENCE, TEXT, "s")
+    )
+
+    assert message.features_present(TEXT)
+    assert message.features_present(TEXT, ["s"])
+    assert not message.features_present(TEXT, ["other"])
+
+    seq_features, sen_features = message.get_dense_features(TEXT)
+    assert np.all(seq_features == [1, 1, 0])
+    assert sen_features is None
+
+    seq_features, sen_features = message.get_sparse_features(TEXT)
+    assert seq_features is None
+    assert np.all(sen_features.toarray() == [1, 2, 1])
+
+
+def test_messages_created_from_same_features_do_not_share_them():
+    features = [Features(np.array([1, 1, 0]), FEATURE_TYPE_SEQUENCE, TEXT, "c1")]
+    message = Message("This is a test sentence.", features=features)
+    other = Message(message.text, features=message.features)
+
+    other.add_features(Features(np.array([1, 2, 1]), FEATURE_TYPE_SEQUENCE, TEXT, "c2"))
+
+    assert len(message.features) == 1
+    assert len(other.features) == 2
+    assert np.all(message.get_dense_features(TEXT)[0] == [1, 1, 0])
+    assert np.all(other.get_dense_features(TEXT)[0] == [1, 2, 1, 1, 1, 0])
+
+
+def test_copied_message_keeps_features():
+    message = Message(
+        "This is a test sentence.",
+        features=[Features(np.array([1, 1, 0]), FEATURE_TYPE_SEQUENCE, TEXT, "c1")],
+    )
+
+    copied = copy.deepcopy(message)
+
+    assert len(copied.features) == 1
+    assert np.all(copied.get_dense_features(TEXT)[0] == [1, 1, 0])
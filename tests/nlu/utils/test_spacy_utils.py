@@ -0,0 +1,95 @@
+from unittest.mock import Mock
+
+import pytest
+
+from rasa.nlu.model import Metadata
+from rasa.nlu.training_data import Message, TrainingData
+from rasa.nlu.utils.spacy_utils import SpacyNLP
+
+
+def test_spacy_pipe_options_are_passed_on(spacy_nlp):
+    nlp = Mock(wraps=spacy_nlp)
+    # empty docs are created from the vocab directly
+    nlp.vocab = spacy_nlp.vocab
+    component = SpacyNLP({"disable": ["ner"], "batch_size": 10}, nlp)
+
+    td = TrainingData(training_examples=[Message.build(text="hello", intent="greet")])
+    component.docs_for_training_data(td)
+
+    for _, kwargs in nlp.pipe.call_args_list:
+        assert kwargs["batch_size"] == 10
+        assert kwargs["disable"] == ["ner"]
+
+    component.doc_for_text("hello")
+
+    _, kwargs = nlp.call_args
+    assert kwargs["disable"] == ["ner"]
+
+
+def test_spacy_disabled_components_do_not_run(spacy_nlp):
+    component = SpacyNLP({"disable": ["tagger", "ner"]}, spacy_nlp)
+
+    doc = component.doc_for_text("I live in Berlin")
+    assert not doc.is_tagged
+    assert len(doc.ents) == 0
+
+    td = TrainingData(
+        training_examples=[Message.build(text="I live in Berlin", intent="inform")]
+    )
+    docs = component.docs_for_training_data(td)["text"]
+    assert not docs[0].is_tagged
+    assert len(docs[0].ents) == 0
+
+    # the default configuration still runs the complete pipeline
+    doc = SpacyNLP({}, spacy_nlp).doc_for_text("I live in Berlin")
+    assert doc.is_tagged
+
+
+def test_spacy_cache_key_includes_options():
+    metadata = Metadata({"language": "en"}, None)
+
+    default_key = SpacyNLP.cache_key({"model": "en_core_web_md"}, metadata)
+
+    assert default_key == SpacyNLP.cache_key(
+        {"model": "en_core_web_md", "disable": [], "batch_size": 50}, metadata
+    )
+    assert default_key != SpacyNLP.cache_key(
+        {"model": "en_core_web_md", "disable": ["ner"]}, metadata
+    )
+    assert default_key != SpacyNLP.cache_key(
+        {"model": "en_core_web_md", "batch_size": 10}, metadata
+    )
+    assert default_key != SpacyNLP.cache_key(
+        {"model": "en_core_web_md", "n_process": 2}, metadata
+    )
+
+
+def test_spacy_n_process_is_passed_on(spacy_nlp, monkeypatch):
+    import spacy
+
+    monkeypatch.setattr(spacy.about, "__version__", "2.2.4")
+    nlp = Mock(wraps=spacy_nlp)
+    nlp.vocab = spacy_nlp.vocab
+    # don't start any worker processes, only check what is passed to spaCy
+    nlp.pipe = Mock(
+        side_effect=lambda texts, **kwargs: [spacy_nlp.make_doc(t) for t in texts]
+    )
+    component = SpacyNLP({"n_process": 2}, nlp)
+
+    td = TrainingData(training_examples=[Message.build(text="hello", intent="greet")])
+    component.docs_for_training_data(td)
+
+    assert nlp.pipe.call_args_list
+    for _, kwargs in nlp.pipe.call_args_list:
+        assert kwargs["n_process"] == 2
+
+
+def test_spacy_n_process_falls_back_for_old_spacy(spacy_nlp, monkeypatch):
+    import spacy
+
+    monkeypatch.setattr(spacy.about, "__version__", "2.1.9")
+
+    with pytest.warns(UserWarning, match="n_process"):
+        component = SpacyNLP({"n_process": 2}, spacy_nlp)
+
+    assert component.component_config["n_process"] == 1